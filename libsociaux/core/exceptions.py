@@ -1,40 +1,40 @@
 class PermissionDenied(Exception):
     """Raised when a user tries to make action that he is not allowed to."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidCredentials(Exception):
     """Raised when the credentials are invalid."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidResponse(Exception):
     """Raised when the response is invalid."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidRequest(Exception):
     """Raised when the request is invalid."""
 
-    pass
+    __slots__ = ()
 
 
 class QuotaExceeded(Exception):
     """Raised when the quota is exceeded."""
 
-    pass
+    __slots__ = ()
 
 
 class NotFound(Exception):
     """Raised when the requested resource is not found."""
 
-    pass
+    __slots__ = ()
 
 
 class ServiceError(Exception):
     """Raised when the service returns an unknown error."""
 
-    pass
+    __slots__ = ()
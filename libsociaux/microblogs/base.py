@@ -7,7 +7,7 @@ class MicroBlogPosts:
         self.service = service
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Post:
     ...
 
@@ -16,7 +16,7 @@ class MicroBlogComments(MicroBlogPosts):
     ...
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Comment(Post):
     ...
 
@@ -26,7 +26,7 @@ class MicroBlogDMs:
         self.service = service
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DM:
     ...
 
@@ -36,7 +36,7 @@ class MicroBlogUsers:
         self.service = service
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class User:
     _service: "MicroBlog"
     id: str
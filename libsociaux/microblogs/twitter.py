@@ -1,32 +1,104 @@
 import dataclasses
+import functools
+import inspect
+import operator
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from cachetools.func import ttl_cache
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
+import requests
+from requests.adapters import HTTPAdapter
 import tweepy
+from urllib3.util.retry import Retry
 
 from libsociaux.core import exceptions as err
 from libsociaux.microblogs import base
 
-PAGINATION_COUNT = 200
+if typing.TYPE_CHECKING:
+    import aiohttp
+    import tweepy.asynchronous
+
+# Page sizes are the per-request maximums accepted by each endpoint.
+DM_PAGINATION_COUNT = 50
+IDS_PAGINATION_COUNT = 5000
+LOOKUP_COUNT = 100
+LOOKUP_WORKERS = 8
 TTL_CACHE_TIME = 900
+USER_CACHE_SIZE = 4096
+LIST_CACHE_SIZE = 64
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) in seconds
+REQUEST_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+V2_PAGINATION_COUNT = 1000
+V2_USER_FIELDS = ["description", "location", "url", "protected"]
+
+_REQUIRED_CONFIG_KEYS = frozenset({"consumer_key", "consumer_secret", "access_token", "access_token_secret"})
+
+_EXC_MAP = {
+    tweepy.errors.Unauthorized: err.InvalidCredentials,
+    tweepy.errors.TooManyRequests: err.QuotaExceeded,
+    tweepy.errors.NotFound: err.NotFound,
+}
+
+
+def _translate_exception(e: tweepy.errors.HTTPException) -> Exception:
+    """Maps a tweepy HTTP error to the matching libsociaux exception."""
+    # Non-JSON error bodies (e.g. proxy or 5xx pages) carry no API messages, only "<status> <reason>".
+    messages = e.api_messages or [str(e)]
+    return _EXC_MAP.get(type(e), err.ServiceError)('\n'.join(messages))
 
 
 def twitter_exception_handler(func):
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except tweepy.errors.Unauthorized as e_unauth:
-            raise err.InvalidCredentials('\n'.join(e_unauth.api_messages)) from e_unauth
-        except tweepy.errors.TooManyRequests as e_tmr:
-            raise err.QuotaExceeded('\n'.join(e_tmr.api_messages)) from e_tmr
-        except tweepy.errors.NotFound as e_nf:
-            raise err.NotFound('\n'.join(e_nf.api_messages)) from e_nf
-        except tweepy.errors.HTTPException as e:
-            raise err.ServiceError('\n'.join(e.api_messages)) from e
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except tweepy.errors.HTTPException as e:
+                raise _translate_exception(e) from e
+
+    elif inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                yield from func(*args, **kwargs)
+            except tweepy.errors.HTTPException as e:
+                raise _translate_exception(e) from e
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except tweepy.errors.HTTPException as e:
+                raise _translate_exception(e) from e
 
     return wrapper
 
 
+class _PersistentSession(requests.Session):
+    """A requests.Session that stays open when tweepy.API closes it at the end of every call."""
+
+    def close(self):
+        # tweepy.API.request() closes its session after each request, which clears the connection pools.
+        pass
+
+
+def _iter_cursor_pages(method, **kwargs) -> typing.Iterator[list]:
+    """Yields consecutive pages of a cursor-paginated API v1.1 method."""
+    cursor = -1
+    while cursor:
+        page, (_, cursor) = method(cursor=cursor, **kwargs)
+        yield page
+
+
 class TwitterUser(base.User):
+    __slots__ = ()
+
     def __repr__(self):
         return f"<{self.__class__.__name__} @{self.username} - {self.full_name}>"
 
@@ -38,33 +110,74 @@ class TwitterUser(base.User):
         :param service: The service that the user belongs to.
         :param tweepy_user: The tweepy.User object to map.
         :return: A libsociaux User object."""
-        return TwitterUser(
-            _service=service,
-            id=tweepy_user.id_str or str(tweepy_user.id),
-            full_name=tweepy_user.name,
-            username=tweepy_user.screen_name,
-            description=tweepy_user.description,
-            location=tweepy_user.location,
-            url=tweepy_user.url,
-            is_private=tweepy_user.protected,
-        )
+        # Called for every user of large follower lists, so the dataclass __init__ (keyword parsing and
+        # defaults) is skipped and the slots are filled directly.
+        user = object.__new__(TwitterUser)
+        user._service = service
+        user.id = tweepy_user.id_str or str(tweepy_user.id)
+        user.full_name = tweepy_user.name
+        user.username = tweepy_user.screen_name
+        user.description = tweepy_user.description
+        user.location = tweepy_user.location
+        user.url = tweepy_user.url
+        user.is_private = tweepy_user.protected
+        return user
+
+    @staticmethod
+    def from_tweepy_v2_user(service: "Twitter", tweepy_user: "tweepy.User") -> "TwitterUser":
+        """
+        Maps an API v2 user object (requested with V2_USER_FIELDS) to a libsociaux User object.
+
+        :param service: The service that the user belongs to.
+        :param tweepy_user: The API v2 user object to map.
+        :return: A libsociaux User object."""
+        user = object.__new__(TwitterUser)
+        user._service = service
+        user.id = str(tweepy_user.id)
+        user.full_name = tweepy_user.name
+        user.username = tweepy_user.username
+        user.description = tweepy_user.description
+        user.location = tweepy_user.location
+        user.url = tweepy_user.url
+        user.is_private = bool(tweepy_user.protected)
+        return user
 
 
 class TwitterUsers(base.MicroBlogUsers):
-    @twitter_exception_handler
+    def __init__(self, service: "Twitter"):
+        super().__init__(service)
+        # TTLCache is not thread-safe and this instance is shared per service, so every cache access holds the lock.
+        self._lock = threading.RLock()
+        self._me_cache = TTLCache(maxsize=1, ttl=TTL_CACHE_TIME)
+        self._user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=TTL_CACHE_TIME)
+        self._list_cache = TTLCache(maxsize=LIST_CACHE_SIZE, ttl=TTL_CACHE_TIME)
+
     @property
+    @twitter_exception_handler
     def current_user(self) -> TwitterUser:
         """
-        Returns the current user profile.
+        Returns the current user profile. Cached for TTL_CACHE_TIME minutes.
         :returns: Current user profile.
         :raises QuotaExceeded: If the quota is exceeded.
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
+        return self._get_current_user()
+
+    @cachedmethod(
+        operator.attrgetter("_me_cache"), key=lambda self: hashkey("current_user"), lock=operator.attrgetter("_lock")
+    )
+    def _get_current_user(self) -> TwitterUser:
         return TwitterUser.from_tweepy_user(self.service, self.service.api.verify_credentials())
 
+    def _cache_user(self, user: TwitterUser) -> TwitterUser:
+        """Stores the user profile in the cache under both its username and its ID."""
+        with self._lock:
+            self._user_cache[("u", user.username.lower())] = user
+            self._user_cache[("i", int(user.id))] = user
+        return user
+
     @twitter_exception_handler
-    @ttl_cache(ttl=900)
     def get_user(self, username: str | None = None, user_id: str | int | None = None) -> TwitterUser:
         """
         Returns user profile by the username. Cached for TTL_CACHE_TIME minutes.
@@ -76,12 +189,74 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises ServiceError: If the service returns an unknown error.
         """
         if username:
-            return TwitterUser.from_tweepy_user(self.service, self.service.api.get_user(screen_name=username))
-        elif user_id:
-            return TwitterUser.from_tweepy_user(self.service, self.service.api.get_user(user_id=user_id))
+            key, kwargs = ("u", username.lower()), {"screen_name": username}
+        elif user_id is not None:
+            user_id = int(user_id)
+            key, kwargs = ("i", user_id), {"user_id": user_id}
         else:
             raise ValueError("Either username or user_id must be provided.")
 
+        with self._lock:
+            user = self._user_cache.get(key)
+        if user is not None:
+            return user
+        return self._cache_user(TwitterUser.from_tweepy_user(self.service, self.service.api.get_user(**kwargs)))
+
+    @staticmethod
+    def _lookup_users(lookup_users, ids: list[int]) -> list[tweepy.User]:
+        # users/lookup answers 404 when none of the IDs resolve (e.g. all deleted), which means an empty batch.
+        try:
+            return lookup_users(user_id=ids)
+        except tweepy.errors.NotFound:
+            return []
+
+    @twitter_exception_handler
+    def get_users(self, ids: list[int]) -> list[TwitterUser]:
+        """
+        Returns user profiles for the given IDs, in the same order. Cached profiles are reused and the
+        rest is fetched in batches of LOOKUP_COUNT per request, concurrently by up to LOOKUP_WORKERS threads.
+        Users that no longer exist are silently omitted.
+        :param ids: List of user IDs.
+        :returns: List of user profiles.
+        :raises QuotaExceeded: If the quota is exceeded.
+        :raises ServiceError: If the service returns an unknown error.
+        """
+        return self._get_users(ids, cache_profiles=True)
+
+    def _get_users(self, ids: list[int], cache_profiles: bool, lookup_users=None) -> list[TwitterUser]:
+        # Bulk listings pass cache_profiles=False: their result is kept in _list_cache already, and writing
+        # thousands of profiles would only evict everything else from the bounded _user_cache.
+        # lookup_users is resolved once here (or by the caller) rather than per chunk in the worker threads.
+        ids = [int(user_id) for user_id in ids]
+        users = {}
+        missing = []
+        with self._lock:
+            for user_id in ids:
+                try:
+                    users[user_id] = self._user_cache[("i", user_id)]
+                except KeyError:
+                    missing.append(user_id)
+
+        # Repeated IDs are looked up once; the result below still follows ids, repeats included.
+        missing = list(dict.fromkeys(missing))
+        service = self.service
+        if lookup_users is None:
+            lookup_users = functools.partial(self._lookup_users, service.api.lookup_users)
+        chunks = [missing[i : i + LOOKUP_COUNT] for i in range(0, len(missing), LOOKUP_COUNT)]
+        if len(chunks) <= 1:
+            pages = [lookup_users(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(LOOKUP_WORKERS, len(chunks))) as executor:
+                pages = list(executor.map(lookup_users, chunks))
+
+        from_tweepy_user = functools.partial(TwitterUser.from_tweepy_user, service)
+        cache_user = self._cache_user if cache_profiles else lambda user: user
+        for page in pages:
+            for user in map(from_tweepy_user, page):
+                users[int(user.id)] = cache_user(user)
+
+        return [users[user_id] for user_id in ids if user_id in users]
+
     @twitter_exception_handler
     def follow(self, username: str) -> TwitterUser:
         """
@@ -92,7 +267,9 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return TwitterUser.from_tweepy_user(self.service, self.service.api.create_friendship(screen_name=username))
+        return self._cache_user(
+            TwitterUser.from_tweepy_user(self.service, self.service.api.create_friendship(screen_name=username))
+        )
 
     @twitter_exception_handler
     def unfollow(self, username: str) -> TwitterUser:
@@ -104,7 +281,9 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return TwitterUser.from_tweepy_user(self.service, self.service.api.destroy_friendship(screen_name=username))
+        return self._cache_user(
+            TwitterUser.from_tweepy_user(self.service, self.service.api.destroy_friendship(screen_name=username))
+        )
 
     @twitter_exception_handler
     def block(self, username: str) -> TwitterUser:
@@ -116,7 +295,9 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return TwitterUser.from_tweepy_user(self.service, self.service.api.create_block(screen_name=username))
+        return self._cache_user(
+            TwitterUser.from_tweepy_user(self.service, self.service.api.create_block(screen_name=username))
+        )
 
     @twitter_exception_handler
     def unblock(self, username: str) -> TwitterUser:
@@ -128,7 +309,9 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return TwitterUser.from_tweepy_user(self.service, self.service.api.destroy_block(screen_name=username))
+        return self._cache_user(
+            TwitterUser.from_tweepy_user(self.service, self.service.api.destroy_block(screen_name=username))
+        )
 
     @twitter_exception_handler
     def mute(self, username: str) -> TwitterUser:
@@ -140,7 +323,9 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return TwitterUser.from_tweepy_user(self.service, self.service.api.create_mute(screen_name=username))
+        return self._cache_user(
+            TwitterUser.from_tweepy_user(self.service, self.service.api.create_mute(screen_name=username))
+        )
 
     @twitter_exception_handler
     def unmute(self, username: str) -> TwitterUser:
@@ -152,10 +337,81 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return TwitterUser.from_tweepy_user(self.service, self.service.api.destroy_mute(screen_name=username))
+        return self._cache_user(
+            TwitterUser.from_tweepy_user(self.service, self.service.api.destroy_mute(screen_name=username))
+        )
+
+    def _iter_users_by_ids(self, ids_method, **kwargs) -> typing.Iterator[TwitterUser]:
+        # Same hydration as list_followers/list_following: cached profiles are reused, none are stored.
+        get_users = functools.partial(
+            self._get_users,
+            cache_profiles=False,
+            lookup_users=functools.partial(self._lookup_users, self.service.api.lookup_users),
+        )
+        for ids in _iter_cursor_pages(ids_method, count=IDS_PAGINATION_COUNT, **kwargs):
+            for i in range(0, len(ids), LOOKUP_COUNT):
+                yield from get_users(ids[i : i + LOOKUP_COUNT])
+
+    @twitter_exception_handler
+    def iter_followers(self, username: str | None = None) -> typing.Iterator[TwitterUser]:
+        """
+        Lazily yields followers of the given user, fetching further pages only as they are consumed.
+        :param username: User's screen name to get followers from. If None, the current user is used.
+        :return: Iterator over followers.
+        :raises QuotaExceeded: If the quota is exceeded.
+        :raises NotFound: If the user is not found.
+        :raises ServiceError: If the service returns an unknown error.
+        """
+        if not username:
+            username = self.current_user.username
+
+        yield from self._iter_users_by_ids(self.service.api.get_follower_ids, screen_name=username)
 
     @twitter_exception_handler
-    @ttl_cache(ttl=TTL_CACHE_TIME)
+    def iter_following(self, username: str | None = None) -> typing.Iterator[TwitterUser]:
+        """
+        Lazily yields users followed by the given user, fetching further pages only as they are consumed.
+        :param username: User's screen name to get following from. If None, the current user is used.
+        :return: Iterator over users followed by the given user.
+        :raises QuotaExceeded: If the quota is exceeded.
+        :raises NotFound: If the user is not found.
+        :raises ServiceError: If the service returns an unknown error.
+        """
+        if not username:
+            username = self.current_user.username
+
+        yield from self._iter_users_by_ids(self.service.api.get_friend_ids, screen_name=username)
+
+    @twitter_exception_handler
+    def iter_blocked(self) -> typing.Iterator[TwitterUser]:
+        """
+        Lazily yields blocked users, fetching further pages only as they are consumed.
+        :return: Iterator over blocked users.
+        :raises QuotaExceeded: If the quota is exceeded.
+        :raises ServiceError: If the service returns an unknown error.
+        """
+        from_tweepy_user = functools.partial(TwitterUser.from_tweepy_user, self.service)
+        for page in _iter_cursor_pages(self.service.api.get_blocks):
+            yield from map(from_tweepy_user, page)
+
+    @twitter_exception_handler
+    def iter_muted(self) -> typing.Iterator[TwitterUser]:
+        """
+        Lazily yields muted users, fetching further pages only as they are consumed.
+        :return: Iterator over muted users.
+        :raises QuotaExceeded: If the quota is exceeded.
+        :raises ServiceError: If the service returns an unknown error.
+        """
+        from_tweepy_user = functools.partial(TwitterUser.from_tweepy_user, self.service)
+        for page in _iter_cursor_pages(self.service.api.get_mutes):
+            yield from map(from_tweepy_user, page)
+
+    @twitter_exception_handler
+    @cachedmethod(
+        operator.attrgetter("_list_cache"),
+        key=lambda self, username=None: hashkey("list_followers", username),
+        lock=operator.attrgetter("_lock"),
+    )
     def list_followers(self, username: str | None = None) -> list[TwitterUser]:
         """
         Returns the list of followers for the given user. Cached for TTL_CACHE_TIME minutes.
@@ -168,14 +424,18 @@ class TwitterUsers(base.MicroBlogUsers):
         if not username:
             username = self.current_user.username
 
-        return [
-            TwitterUser.from_tweepy_user(self.service, user)
-            for user in
-            tweepy.Cursor(self.service.api.get_followers, count=PAGINATION_COUNT, screen_name=username).items()
-        ]
+        ids = []
+        pages = _iter_cursor_pages(self.service.api.get_follower_ids, count=IDS_PAGINATION_COUNT, screen_name=username)
+        for page in pages:
+            ids.extend(page)
+        return self._get_users(ids, cache_profiles=False)
 
     @twitter_exception_handler
-    @ttl_cache(ttl=TTL_CACHE_TIME)
+    @cachedmethod(
+        operator.attrgetter("_list_cache"),
+        key=lambda self, username=None: hashkey("list_following", username),
+        lock=operator.attrgetter("_lock"),
+    )
     def list_following(self, username: str | None = None) -> list[TwitterUser]:
         """
         Returns the list of users followed by the given user. Cached for TTL_CACHE_TIME minutes.
@@ -188,14 +448,76 @@ class TwitterUsers(base.MicroBlogUsers):
         if not username:
             username = self.current_user.username
 
-        return [
-            TwitterUser.from_tweepy_user(self.service, user)
-            for user in
-            tweepy.Cursor(self.service.api.get_friends, count=PAGINATION_COUNT, screen_name=username).items()
-        ]
+        ids = []
+        pages = _iter_cursor_pages(self.service.api.get_friend_ids, count=IDS_PAGINATION_COUNT, screen_name=username)
+        for page in pages:
+            ids.extend(page)
+        return self._get_users(ids, cache_profiles=False)
+
+    async def _list_users_async(self, cache_name: str, method_name: str, username: str | None) -> list[TwitterUser]:
+        import aiohttp
+        from tweepy.asynchronous import AsyncPaginator
+
+        key = hashkey(cache_name, username)
+        with self._lock:
+            users = self._list_cache.get(key)
+        if users is not None:
+            return users
+
+        timeout = aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1])
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            client = self.service.async_client(session)
+            if username:
+                response = await client.get_user(username=username, user_auth=True)
+            else:
+                response = await client.get_me(user_auth=True)
+            if response.data is None:
+                raise err.NotFound('\n'.join(error.get("detail", "") for error in response.errors))
+
+            pages = AsyncPaginator(
+                getattr(client, method_name),
+                response.data.id,
+                max_results=V2_PAGINATION_COUNT,
+                user_fields=V2_USER_FIELDS,
+                user_auth=True,
+            )
+            from_tweepy_user = functools.partial(TwitterUser.from_tweepy_v2_user, self.service)
+            users = [from_tweepy_user(user) async for user in pages.flatten()]
+
+        with self._lock:
+            self._list_cache[key] = users
+        return users
+
+    @twitter_exception_handler
+    async def list_followers_async(self, username: str | None = None) -> list[TwitterUser]:
+        """
+        Asynchronous variant of list_followers using API v2 over aiohttp (requires tweepy[async]).
+        Shares the cache with list_followers.
+        :param username: User's screen name to get followers from. If None, the current user is used.
+        :return: List of followers.
+        :raises QuotaExceeded: If the quota is exceeded.
+        :raises NotFound: If the user is not found.
+        :raises ServiceError: If the service returns an unknown error.
+        """
+        return await self._list_users_async("list_followers", "get_users_followers", username)
+
+    @twitter_exception_handler
+    async def list_following_async(self, username: str | None = None) -> list[TwitterUser]:
+        """
+        Asynchronous variant of list_following using API v2 over aiohttp (requires tweepy[async]).
+        Shares the cache with list_following.
+        :param username: User's screen name to get following from. If None, the current user is used.
+        :return: List of users followed by the given user.
+        :raises QuotaExceeded: If the quota is exceeded.
+        :raises NotFound: If the user is not found.
+        :raises ServiceError: If the service returns an unknown error.
+        """
+        return await self._list_users_async("list_following", "get_users_following", username)
 
     @twitter_exception_handler
-    @ttl_cache(ttl=TTL_CACHE_TIME)
+    @cachedmethod(
+        operator.attrgetter("_list_cache"), key=lambda self: hashkey("list_blocked"), lock=operator.attrgetter("_lock")
+    )
     def list_blocked(self) -> list[TwitterUser]:
         """
         Returns the list of blocked users. Cached for TTL_CACHE_TIME minutes.
@@ -203,13 +525,12 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises QuotaExceeded: If the quota is exceeded.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return [
-            TwitterUser.from_tweepy_user(self.service, user)
-            for user in tweepy.Cursor(self.service.api.get_blocks).items()
-        ]
+        return list(self.iter_blocked())
 
     @twitter_exception_handler
-    @ttl_cache(ttl=TTL_CACHE_TIME)
+    @cachedmethod(
+        operator.attrgetter("_list_cache"), key=lambda self: hashkey("list_muted"), lock=operator.attrgetter("_lock")
+    )
     def list_muted(self) -> list[TwitterUser]:
         """
         Returns the list of muted users. Cached for TTL_CACHE_TIME minutes.
@@ -217,13 +538,10 @@ class TwitterUsers(base.MicroBlogUsers):
         :raises QuotaExceeded: If the quota is exceeded.
         :raises ServiceError: If the service returns an unknown error.
         """
-        return [
-            TwitterUser.from_tweepy_user(self.service, user)
-            for user in tweepy.Cursor(self.service.api.get_mutes).items()
-        ]
+        return list(self.iter_muted())
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TwitterDM(base.DM):
     id: str
     sender: TwitterUser
@@ -236,13 +554,27 @@ class TwitterDM(base.DM):
         return f"<TwitterDM @{self.sender.username} to @{', @'.join([i.username for i in self.recipients])}>"
 
     @staticmethod
-    def from_tweepy_dm(service: base.MicroBlog, dm: tweepy.DirectMessageEvent) -> "TwitterDM":
+    def from_tweepy_dm(
+        service: base.MicroBlog, dm: tweepy.DirectMessageEvent, users: dict[int, TwitterUser] | None = None
+    ) -> "TwitterDM":
+        """
+        Maps a tweepy.DirectMessageEvent object to a libsociaux DM object.
+
+        :param service: The service that the DM belongs to.
+        :param dm: The tweepy.DirectMessageEvent object to map.
+        :param users: Already fetched participants by ID, which must include both the sender and the recipient.
+            If None, the participants are fetched one by one.
+        :return: A libsociaux DM object."""
+        sender_id = int(dm.message_create['sender_id'])
+        recipient_id = int(dm.message_create['target']['recipient_id'])
+        if users is None:
+            users = {user_id: service.users.get_user(user_id=user_id) for user_id in (sender_id, recipient_id)}
         return TwitterDM(
             id=dm.id,
-            sender=service.users.get_user(user_id=int(dm.message_create['sender_id'])),
-            recipients=[service.users.get_user(user_id=int(dm.message_create['target']['recipient_id']))],
+            sender=users[sender_id],
+            recipients=[users[recipient_id]],
             text=dm.message_create['message_data']['text'],
-            created_at=datetime.fromtimestamp(int(dm.created_timestamp) / 1000000000),
+            created_at=datetime.fromtimestamp(int(dm.created_timestamp) / 1000),
             is_read=None,
         )
 
@@ -260,19 +592,31 @@ class TwitterDMs(base.MicroBlogDMs):
         # return TwitterDM.from_tweepy_dm(self.service, self.service.api.get_direct_message(dm_id))
         ...
 
+    @twitter_exception_handler
     def list_threads(self, username: str | None = None) -> list[TwitterDM]:
         """
-        Returns the list of DMs.
+        Returns the list of DMs. DMs with a participant that no longer exists (deleted or suspended) are skipped.
         :param username: User's screen name to get DMs from. If None, the current user is used.
         :return: List of DMs.
         :raises QuotaExceeded: If the quota is exceeded.
         :raises NotFound: If the user is not found.
         :raises ServiceError: If the service returns an unknown error.
         """
+        dms = list(tweepy.Cursor(self.service.api.get_direct_messages, count=DM_PAGINATION_COUNT).items())
+
+        participants = [
+            (int(dm.message_create['sender_id']), int(dm.message_create['target']['recipient_id'])) for dm in dms
+        ]
+        service = self.service
+        participant_ids = {user_id for pair in participants for user_id in pair}
+        users = {int(user.id): user for user in service.users.get_users(list(participant_ids))}
+
+        # users/lookup leaves out deleted or suspended accounts, and looking them up one by one would only 404.
+        from_tweepy_dm = functools.partial(TwitterDM.from_tweepy_dm, service, users=users)
         return [
-            TwitterDM.from_tweepy_dm(self.service, dm)
-            for dm in
-            tweepy.Cursor(self.service.api.get_direct_messages, count=PAGINATION_COUNT).items()
+            from_tweepy_dm(dm)
+            for dm, (sender_id, recipient_id) in zip(dms, participants)
+            if sender_id in users and recipient_id in users
         ]
 
 
@@ -285,31 +629,59 @@ class Twitter(base.MicroBlog):
         super().__init__(config)
 
         self.config = config
-        for key in ("consumer_key", "consumer_secret", "access_token", "access_token_secret"):
-            if key not in config.keys():
-                raise ValueError(f"Missing {key} in Twitter config")
+        missing = _REQUIRED_CONFIG_KEYS - config.keys()
+        if missing:
+            raise ValueError(f"Missing {', '.join(sorted(missing))} in Twitter config")
+
+        self._api = None
 
     @property
     def api(self) -> tweepy.API:
         """
-        Creates a new tweepy.API object.
-        :return: A new API object to call the Twitter API.
+        Returns the tweepy.API object, creating it on first access. The same object is reused for all
+        subsequent calls, and its HTTP session is kept open between them so keep-alive connections are
+        pooled (up to LOOKUP_WORKERS per host, one per lookup thread). Requests time out after
+        REQUEST_TIMEOUT and failed connections or 5xx responses to idempotent calls are retried with backoff.
+        :return: API object to call the Twitter API.
         :raises InvalidCredentials: If the credentials are invalid.
         :raises ServiceError: If the service returns an unknown error.
         """
-        auth = tweepy.OAuth1UserHandler(
-            self.config["consumer_key"],
-            self.config["consumer_secret"],
-            self.config["access_token"],
-            self.config["access_token_secret"],
+        if self._api is None:
+            auth = tweepy.OAuth1UserHandler(
+                self.config["consumer_key"],
+                self.config["consumer_secret"],
+                self.config["access_token"],
+                self.config["access_token_secret"],
+            )
+            self._api = tweepy.API(auth, wait_on_rate_limit=True, timeout=REQUEST_TIMEOUT)
+            self._api.session = _PersistentSession()
+            self._api.session.mount("https://", HTTPAdapter(pool_maxsize=LOOKUP_WORKERS, max_retries=REQUEST_RETRIES))
+
+        return self._api
+
+    def async_client(self, session: "aiohttp.ClientSession") -> "tweepy.asynchronous.AsyncClient":
+        """
+        Creates a tweepy AsyncClient (API v2, user context) that sends its requests through the given
+        aiohttp session, so that connections are reused between calls. Requires tweepy[async].
+        :param session: Open aiohttp session owned by the caller.
+        :return: An async client to call the Twitter API v2.
+        """
+        from tweepy.asynchronous import AsyncClient
+
+        client = AsyncClient(
+            consumer_key=self.config["consumer_key"],
+            consumer_secret=self.config["consumer_secret"],
+            access_token=self.config["access_token"],
+            access_token_secret=self.config["access_token_secret"],
+            wait_on_rate_limit=True,
         )
+        client.session = session
+        return client
 
-        return tweepy.API(auth, wait_on_rate_limit=True)
-
-    @property
+    @functools.cached_property
     def users(self) -> TwitterUsers:
         return TwitterUsers(service=self)
 
-    @property
+    @functools.cached_property
     def dms(self) -> TwitterDMs:
         return TwitterDMs(service=self)
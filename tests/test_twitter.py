@@ -0,0 +1,320 @@
+import asyncio
+import types
+from datetime import datetime
+
+import pytest
+import requests
+import tweepy
+
+from libsociaux.core import exceptions as err
+from libsociaux.microblogs.twitter import LOOKUP_COUNT, LOOKUP_WORKERS, Twitter, TwitterDM, TwitterUser
+
+CONFIG = {
+    "consumer_key": "consumer-key",
+    "consumer_secret": "consumer-secret",
+    "access_token": "access-token",
+    "access_token_secret": "access-token-secret",
+}
+
+
+def make_user(user_id: int) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        id=user_id,
+        id_str=str(user_id),
+        name=f"User {user_id}",
+        screen_name=f"user{user_id}",
+        description="",
+        location="",
+        url=None,
+        protected=False,
+    )
+
+
+def make_response(status_code: int, reason: str, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response._content = body
+    return response
+
+
+class FakeAPI:
+    def __init__(
+        self,
+        error: Exception | None = None,
+        follower_id_pages: list | None = None,
+        missing_ids: set[int] | None = None,
+        lookup_errors: dict[int, Exception] | None = None,
+        dms: list | None = None,
+    ):
+        self.error = error
+        self.follower_id_pages = follower_id_pages or [[]]
+        self.missing_ids = missing_ids or set()
+        self.lookup_errors = lookup_errors or {}
+        self.dms = dms or []
+        self.calls = []
+
+    def verify_credentials(self):
+        self.calls.append("verify_credentials")
+        if self.error:
+            raise self.error
+        return make_user(1)
+
+    def get_user(self, screen_name: str | None = None, user_id: int | None = None):
+        self.calls.append(("get_user", screen_name or user_id))
+        return make_user(user_id or int(screen_name.lower().removeprefix("user")))
+
+    def create_friendship(self, screen_name: str):
+        self.calls.append(("create_friendship", screen_name))
+        return make_user(int(screen_name.lower().removeprefix("user")))
+
+    def get_follower_ids(self, cursor: int, **kwargs):
+        # Cursors are page indexes here; -1 is the first page and 0 means there are no more pages.
+        index = max(cursor, 0)
+        self.calls.append(("get_follower_ids", index))
+        page = self.follower_id_pages[index]
+        if isinstance(page, Exception):
+            raise page
+        next_cursor = index + 1 if index + 1 < len(self.follower_id_pages) else 0
+        return page, (index, next_cursor)
+
+    def get_direct_messages(self, **kwargs):
+        self.calls.append("get_direct_messages")
+        return self.dms
+
+    get_direct_messages.pagination_mode = "dm_cursor"
+
+    def lookup_users(self, user_id: list[int]):
+        self.calls.append(("lookup_users", list(user_id)))
+        for failing_id, error in self.lookup_errors.items():
+            if failing_id in user_id:
+                raise error
+        users = [make_user(i) for i in user_id if i not in self.missing_ids]
+        if not users:
+            raise tweepy.errors.NotFound(
+                make_response(404, "Not Found", b'{"errors": [{"code": 17, "message": "No user matches."}]}')
+            )
+        return users
+
+
+def make_dm(dm_id: str, sender_id: int, recipient_id: int) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        id=dm_id,
+        created_timestamp="1700000000123",
+        message_create={
+            "sender_id": str(sender_id),
+            "target": {"recipient_id": str(recipient_id)},
+            "message_data": {"text": "Hi"},
+        },
+    )
+
+
+def lookup_calls(api: FakeAPI) -> list[list[int]]:
+    # Batches are looked up concurrently, so they are compared in a stable order.
+    return sorted(call[1] for call in api.calls if call[0] == "lookup_users")
+
+
+def make_twitter(api: FakeAPI) -> Twitter:
+    service = Twitter(CONFIG)
+    service._api = api
+    return service
+
+
+def test_current_user_translates_unauthorized():
+    error = tweepy.errors.Unauthorized(
+        make_response(401, "Unauthorized", b'{"errors": [{"code": 89, "message": "Invalid or expired token."}]}')
+    )
+    twitter = make_twitter(FakeAPI(error))
+
+    with pytest.raises(err.InvalidCredentials, match="Invalid or expired token."):
+        twitter.users.current_user
+
+
+def test_current_user_is_cached():
+    api = FakeAPI()
+    twitter = make_twitter(api)
+
+    assert repr(twitter) == "<Twitter user1>"
+    assert repr(twitter) == "<Twitter user1>"
+    assert api.calls == ["verify_credentials"]
+
+
+def test_config_reports_all_missing_keys():
+    with pytest.raises(
+        ValueError, match="^Missing access_token, access_token_secret, consumer_secret in Twitter config$"
+    ):
+        Twitter({"consumer_key": "consumer-key"})
+
+
+def test_api_session_keeps_connection_pools():
+    session = Twitter(CONFIG).api.session
+    adapter = session.get_adapter("https://api.twitter.com")
+    adapter.poolmanager.connection_from_url("https://api.twitter.com")
+
+    # tweepy.API closes its session after every request
+    session.close()
+
+    assert len(adapter.poolmanager.pools) == 1
+    assert adapter._pool_maxsize == LOOKUP_WORKERS
+
+
+def test_get_user_is_cached_by_username_and_id():
+    api = FakeAPI()
+    twitter = make_twitter(api)
+
+    user = twitter.users.get_user(username="User5")
+
+    assert twitter.users.get_user(user_id="5") is user
+    assert twitter.users.get_user(username="user5") is user
+    assert api.calls == [("get_user", "User5")]
+
+
+def test_get_user_normalises_user_id():
+    api = FakeAPI()
+    twitter = make_twitter(api)
+
+    user = twitter.users.get_user(user_id="123")
+
+    assert twitter.users.get_user(user_id=123) is user
+    assert api.calls == [("get_user", 123)]
+
+
+def test_follow_caches_the_returned_profile():
+    api = FakeAPI()
+    twitter = make_twitter(api)
+
+    user = twitter.users.follow("user6")
+
+    assert twitter.users.get_user(username="USER6") is user
+    assert twitter.users.get_user(user_id=6) is user
+    assert api.calls == [("create_friendship", "user6")]
+
+
+def test_dm_created_at_is_parsed_from_milliseconds():
+    twitter = make_twitter(FakeAPI())
+    users = {user_id: TwitterUser.from_tweepy_user(twitter, make_user(user_id)) for user_id in (1, 2)}
+
+    created_at = TwitterDM.from_tweepy_dm(twitter, make_dm("1", 1, 2), users).created_at
+
+    assert created_at == datetime.fromtimestamp(1700000000.123)
+    assert created_at.year == 2023
+
+
+def test_get_users_looks_up_in_chunks():
+    api = FakeAPI()
+    twitter = make_twitter(api)
+    ids = list(range(1, 2 * LOOKUP_COUNT + 51))
+
+    twitter.users.get_users(ids)
+
+    assert lookup_calls(api) == [ids[:LOOKUP_COUNT], ids[LOOKUP_COUNT : 2 * LOOKUP_COUNT], ids[2 * LOOKUP_COUNT :]]
+
+
+def test_get_users_keeps_input_order():
+    twitter = make_twitter(FakeAPI(missing_ids={150}))
+    ids = list(range(2 * LOOKUP_COUNT, 0, -1))
+
+    users = twitter.users.get_users(ids)
+
+    assert [int(user.id) for user in users] == [user_id for user_id in ids if user_id != 150]
+
+
+def test_get_users_looks_up_repeated_ids_once():
+    api = FakeAPI()
+    twitter = make_twitter(api)
+
+    users = twitter.users.get_users([2, 1, "2", 3, 1])
+
+    assert lookup_calls(api) == [[2, 1, 3]]
+    assert [user.id for user in users] == ["2", "1", "2", "3", "1"]
+
+
+def test_get_users_skips_cached_ids():
+    api = FakeAPI()
+    twitter = make_twitter(api)
+    twitter.users.get_users([1, 2])
+    api.calls.clear()
+
+    users = twitter.users.get_users(["3", 2, 1])
+
+    assert lookup_calls(api) == [[3]]
+    assert [user.id for user in users] == ["3", "2", "1"]
+
+
+def test_get_users_all_missing_batch_is_empty():
+    twitter = make_twitter(FakeAPI(missing_ids={1, 2}))
+
+    assert twitter.users.get_users([1, 2]) == []
+
+
+def test_list_followers_does_not_cache_profiles():
+    api = FakeAPI(follower_id_pages=[[1, 2, 3]])
+    twitter = make_twitter(api)
+
+    users = twitter.users.list_followers("someone")
+
+    assert [user.id for user in users] == ["1", "2", "3"]
+    assert len(twitter.users._user_cache) == 0
+
+
+def test_list_followers_translates_worker_errors():
+    error = tweepy.errors.TooManyRequests(
+        make_response(429, "Too Many Requests", b'{"errors": [{"code": 88, "message": "Rate limit exceeded"}]}')
+    )
+    ids = list(range(1, 3 * LOOKUP_COUNT + 1))
+    api = FakeAPI(follower_id_pages=[ids], lookup_errors={LOOKUP_COUNT + 1: error})
+    twitter = make_twitter(api)
+
+    with pytest.raises(err.QuotaExceeded, match="Rate limit exceeded"):
+        twitter.users.list_followers("someone")
+    assert len(lookup_calls(api)) == 3
+
+
+def test_generator_errors_are_translated_mid_iteration():
+    error = tweepy.errors.TooManyRequests(
+        make_response(429, "Too Many Requests", b'{"errors": [{"code": 88, "message": "Rate limit exceeded"}]}')
+    )
+    twitter = make_twitter(FakeAPI(follower_id_pages=[[1, 2], error]))
+
+    users = twitter.users.iter_followers("someone")
+
+    assert [next(users).id, next(users).id] == ["1", "2"]
+    with pytest.raises(err.QuotaExceeded, match="Rate limit exceeded"):
+        next(users)
+
+
+def test_coroutine_errors_are_translated():
+    pytest.importorskip("tweepy.asynchronous")
+    error = tweepy.errors.Unauthorized(
+        make_response(401, "Unauthorized", b'{"errors": [{"code": 89, "message": "Invalid or expired token."}]}')
+    )
+
+    class FakeAsyncClient:
+        async def get_user(self, **kwargs):
+            raise error
+
+    twitter = make_twitter(FakeAPI())
+    twitter.async_client = lambda session: FakeAsyncClient()
+
+    with pytest.raises(err.InvalidCredentials, match="Invalid or expired token."):
+        asyncio.run(twitter.users.list_followers_async("someone"))
+
+
+def test_non_json_error_falls_back_to_status_text():
+    error = tweepy.errors.TwitterServerError(make_response(503, "Service Unavailable", b"<html>Over capacity</html>"))
+    twitter = make_twitter(FakeAPI(error))
+
+    with pytest.raises(err.ServiceError, match="503 Service Unavailable"):
+        twitter.users.current_user
+
+
+def test_list_threads_skips_dms_with_missing_participants():
+    api = FakeAPI(missing_ids={7}, dms=[make_dm("1", 1, 2), make_dm("2", 1, 7), make_dm("3", 7, 2)])
+    twitter = make_twitter(api)
+
+    dms = twitter.dms.list_threads()
+
+    assert [dm.id for dm in dms] == ["1"]
+    # No users/show fallback for the participant that users/lookup left out.
+    assert len(api.calls) == 2
+    assert sorted(api.calls[1][1]) == [1, 2, 7]